@@ -1,5 +1,6 @@
 import re
 from enum import Enum, unique
+from functools import lru_cache
 
 from data_refinery_common import utils
 from data_refinery_common.logging import get_and_configure_logger
@@ -170,12 +171,16 @@ def is_file_rnaseq(filename: str) -> bool:
     )
 
 
+@lru_cache(maxsize=128)
 def _is_platform_supported(platform: str) -> bool:
     """Determines if platform is a platform_accession we support or not.
 
     It does so by trying to correct for common string issues such as
     case and spacing and then comparing against our configuration
     files which specify which platform are supported.
+
+    The configuration files don't change while we're running, so the
+    answer for each platform is cached.
     """
     upper_platform = platform.upper()
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 
 from data_refinery_common import job_lookup
 from data_refinery_common.job_lookup import (
@@ -7,23 +7,31 @@ from data_refinery_common.job_lookup import (
     determine_ram_amount,
 )
 from data_refinery_common.logging import get_and_configure_logger
-from data_refinery_common.message_queue import send_job
+from data_refinery_common.message_queue import send_jobs
 from data_refinery_common.models import (
     DownloaderJob,
     DownloaderJobOriginalFileAssociation,
     OriginalFile,
     ProcessorJob,
     ProcessorJobOriginalFileAssociation,
+    Sample,
 )
 from data_refinery_common.utils import get_volume_index
 
 logger = get_and_configure_logger(__name__)
 
+# The number of associations to insert with a single query.
+BATCH_SIZE = 500
+
 
 def create_downloader_job(
-    undownloaded_files: List[OriginalFile], *, processor_job_id=None, force=False
+    undownloaded_files: List[OriginalFile], *, processor_job_id=None, force=False, sample=None
 ) -> bool:
-    """Creates a downloader job to download `undownloaded_files`."""
+    """Creates a downloader job to download `undownloaded_files`.
+
+    If the caller already has the Sample that `undownloaded_files`
+    belong to it can be passed as `sample` to avoid looking it up again.
+    """
     if not undownloaded_files:
         return False
 
@@ -71,7 +79,7 @@ def create_downloader_job(
                 pass
 
     if not original_downloader_job:
-        sample_object = list(undownloaded_files)[0].samples.first()
+        sample_object = sample if sample else list(undownloaded_files)[0].samples.first()
         if sample_object:
             downloader_task = job_lookup.determine_downloader_task(sample_object)
 
@@ -153,29 +161,66 @@ def create_processor_jobs_for_original_files(
     original_files: List[OriginalFile],
     downloader_job: DownloaderJob = None,
     volume_index: str = None,
+    sample: Sample = None,
 ):
     """
     Creates one processor job for each original file given.
+
+    All of the jobs are created before any of them are queued so that
+    they can be dispatched to Nomad in parallel. If all of the files
+    belong to the same Sample it can be passed as `sample` to avoid
+    looking it up for each file.
     """
+    jobs_to_send = []
     for original_file in original_files:
-        create_processor_job_for_original_files([original_file], downloader_job, volume_index)
+        job_to_send = _create_processor_job_for_original_files(
+            [original_file], downloader_job, volume_index, sample
+        )
+        if job_to_send:
+            jobs_to_send.append(job_to_send)
+
+    send_jobs(jobs_to_send)
 
 
 def create_processor_job_for_original_files(
     original_files: List[OriginalFile],
     downloader_job: DownloaderJob = None,
     volume_index: str = None,
+    sample: Sample = None,
 ):
     """
     Create a processor job and queue a processor task for sample related to an experiment.
+
+    If the caller already has the Sample that `original_files` belong
+    to it can be passed as `sample` to avoid looking it up again.
+    """
+    job_to_send = _create_processor_job_for_original_files(
+        original_files, downloader_job, volume_index, sample
+    )
+
+    if job_to_send:
+        send_jobs([job_to_send])
+
+
+def _create_processor_job_for_original_files(
+    original_files: List[OriginalFile],
+    downloader_job: DownloaderJob = None,
+    volume_index: str = None,
+    sample: Sample = None,
+) -> Optional[Tuple[ProcessorPipeline, ProcessorJob]]:
+    """
+    Creates a processor job for sample related to an experiment, without queuing it.
+
+    Returns the pipeline and the job that should be queued for it, or
+    None if no job was created.
     """
 
     # If there's no original files then we've created all the jobs we need to!
     if len(original_files) == 0:
-        return
+        return None
 
     # For anything that has raw data there should only be one Sample per OriginalFile
-    sample_object = original_files[0].samples.first()
+    sample_object = sample if sample else original_files[0].samples.first()
     pipeline_to_apply = determine_processor_pipeline(sample_object, original_files[0])
 
     if pipeline_to_apply == ProcessorPipeline.NONE:
@@ -186,44 +231,45 @@ def create_processor_job_for_original_files(
         )
         for original_file in original_files:
             original_file.delete_local_file()
+
+        return None
+
+    processor_job = ProcessorJob()
+    processor_job.pipeline_applied = pipeline_to_apply.value
+    processor_job.ram_amount = determine_ram_amount(sample_object, processor_job)
+
+    if volume_index:
+        processor_job.volume_index = volume_index
+    elif downloader_job.volume_index:
+        processor_job.volume_index = downloader_job.volume_index
     else:
-        processor_job = ProcessorJob()
-        processor_job.pipeline_applied = pipeline_to_apply.value
-        processor_job.ram_amount = determine_ram_amount(sample_object, processor_job)
-
-        if volume_index:
-            processor_job.volume_index = volume_index
-        elif downloader_job.volume_index:
-            processor_job.volume_index = downloader_job.volume_index
-        else:
-            processor_job.volume_index = get_volume_index()
+        processor_job.volume_index = get_volume_index()
 
-        processor_job.save()
+    processor_job.save()
 
-        for original_file in original_files:
-            if original_file.is_blacklisted():
-                logger.debug(
-                    "Original file had a blacklisted extension of %s, skipping",
-                    extension=original_file.get_extension(),
-                    original_file=original_file.id,
-                )
-                original_file.delete_local_file()
-                continue
-
-            assoc = ProcessorJobOriginalFileAssociation()
-            assoc.original_file = original_file
-            assoc.processor_job = processor_job
-            assoc.save()
-
-        logger.debug(
-            "Queuing processor job.",
-            processor_job=processor_job.id,
-            downloader_job=downloader_job.id if downloader_job else None,
+    assocs = []
+    for original_file in original_files:
+        if original_file.is_blacklisted():
+            logger.debug(
+                "Original file had a blacklisted extension of %s, skipping",
+                extension=original_file.get_extension(),
+                original_file=original_file.id,
+            )
+            original_file.delete_local_file()
+            continue
+
+        assocs.append(
+            ProcessorJobOriginalFileAssociation(
+                original_file=original_file, processor_job=processor_job
+            )
         )
 
-        try:
-            send_job(pipeline_to_apply, processor_job)
-        except Exception:
-            # If we cannot queue the job now the Foreman will do
-            # it later.
-            pass
+    ProcessorJobOriginalFileAssociation.objects.bulk_create(assocs, batch_size=BATCH_SIZE)
+
+    logger.debug(
+        "Queuing processor job.",
+        processor_job=processor_job.id,
+        downloader_job=downloader_job.id if downloader_job else None,
+    )
+
+    return (pipeline_to_apply, processor_job)
@@ -2,7 +2,9 @@
 
 from __future__ import absolute_import, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 
@@ -28,6 +30,9 @@ NOMAD_TRANSCRIPTOME_JOB = "TRANSCRIPTOME_INDEX"
 NOMAD_DOWNLOADER_JOB = "DOWNLOADER"
 NONE_JOB_ERROR_TEMPLATE = "send_job was called with NONE job_type: {} for {} job {}"
 
+# The most jobs send_jobs will dispatch to Nomad at the same time.
+MAX_DISPATCH_THREADS = 16
+
 
 def send_job(job_type: Enum, job, is_dispatch=False) -> bool:
     """Queues a worker job by sending a Nomad Job dispatch message.
@@ -38,10 +43,21 @@ def send_job(job_type: Enum, job, is_dispatch=False) -> bool:
 
     Returns True if the job was successfully dispatch, return False otherwise.
     """
-    nomad_host = get_env_variable("NOMAD_HOST")
-    nomad_port = get_env_variable("NOMAD_PORT", "4646")
-    nomad_client = nomad.Nomad(nomad_host, port=int(nomad_port), timeout=30)
+    nomad_job = _prepare_nomad_job(job_type, job, is_dispatch)
+
+    if nomad_job:
+        job.nomad_job_id = _dispatch_nomad_job(nomad_job, job_type, job)
+        job.save()
+
+    return True
+
 
+def _prepare_nomad_job(job_type: Enum, job, is_dispatch=False) -> Optional[str]:
+    """Determines which Nomad job should be dispatched to run `job`.
+
+    Returns None if the job shouldn't be dispatched directly, in which
+    case the Foreman will handle it.
+    """
     is_processor = True
     if (
         job_type is ProcessorPipeline.TRANSCRIPTOME_INDEX_LONG
@@ -111,32 +127,109 @@ def send_job(job_type: Enum, job, is_dispatch=False) -> bool:
             volume_index = job.volume_index if settings.RUNNING_IN_CLOUD else "0"
             nomad_job = nomad_job + "_" + volume_index + "_" + str(job.ram_amount)
 
+        return nomad_job
+    else:
+        job.num_retries = job.num_retries - 1
+        job.save()
+        return None
+
+
+def _dispatch_nomad_job(nomad_job: str, job_type: Enum, job) -> str:
+    """Dispatches `nomad_job` to run `job` and returns the id of the dispatched Nomad job.
+
+    This only talks to Nomad and doesn't touch the database, so it is
+    safe to call from another thread.
+    """
+    nomad_host = get_env_variable("NOMAD_HOST")
+    nomad_port = get_env_variable("NOMAD_PORT", "4646")
+    nomad_client = nomad.Nomad(nomad_host, port=int(nomad_port), timeout=30)
+
+    try:
+        nomad_response = nomad_client.job.dispatch_job(
+            nomad_job, meta={"JOB_NAME": job_type.value, "JOB_ID": str(job.id)}
+        )
+        return nomad_response["DispatchedJobID"]
+    except URLNotFoundNomadException:
+        logger.info(
+            "Dispatching Nomad job of type %s for job spec %s to host %s and port %s failed.",
+            job_type,
+            nomad_job,
+            nomad_host,
+            nomad_port,
+            job=str(job.id),
+        )
+        raise
+    except Exception as e:
+        logger.info(
+            "Unable to Dispatch Nomad Job.",
+            job_name=job_type.value,
+            job_id=str(job.id),
+            reason=str(e),
+        )
+        raise
+
+
+def _try_dispatch_nomad_job(nomad_job_type_and_job: Tuple[str, Enum, object]) -> Optional[str]:
+    """Calls _dispatch_nomad_job, returning None instead of raising if it fails."""
+    try:
+        return _dispatch_nomad_job(*nomad_job_type_and_job)
+    except Exception:
+        # If we cannot queue the job now the Foreman will do it later.
+        return None
+
+
+def send_jobs(jobs: List[Tuple[Enum, object]]) -> int:
+    """Queues each (job_type, job) pair in jobs the same way send_job does.
+
+    Each dispatch is a separate request to Nomad, so they're made in
+    parallel. Only those requests are made from other threads, the jobs
+    are saved from the calling thread so that they can see rows from
+    its transaction. A job that can't be queued doesn't prevent the
+    others from being queued.
+
+    Returns the number of jobs that were successfully queued.
+    """
+    queued_count = 0
+    jobs_to_dispatch = []
+    for job_type, job in jobs:
         try:
-            nomad_response = nomad_client.job.dispatch_job(
-                nomad_job, meta={"JOB_NAME": job_type.value, "JOB_ID": str(job.id)}
-            )
-            job.nomad_job_id = nomad_response["DispatchedJobID"]
+            nomad_job = _prepare_nomad_job(job_type, job)
+        except Exception:
+            # If we cannot queue the job now the Foreman will do it later.
+            continue
+
+        if nomad_job:
+            jobs_to_dispatch.append((nomad_job, job_type, job))
+        else:
+            # The Foreman will dispatch it.
+            queued_count += 1
+
+    if not jobs_to_dispatch:
+        return queued_count
+
+    if len(jobs_to_dispatch) == 1:
+        # There's nothing to parallelize, so don't bother with a thread.
+        nomad_job_ids = [_try_dispatch_nomad_job(jobs_to_dispatch[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(jobs_to_dispatch), MAX_DISPATCH_THREADS)
+        ) as executor:
+            nomad_job_ids = list(executor.map(_try_dispatch_nomad_job, jobs_to_dispatch))
+
+    for (_, _, job), nomad_job_id in zip(jobs_to_dispatch, nomad_job_ids):
+        if not nomad_job_id:
+            continue
+
+        try:
+            job.nomad_job_id = nomad_job_id
             job.save()
-            return True
-        except URLNotFoundNomadException:
-            logger.info(
-                "Dispatching Nomad job of type %s for job spec %s to host %s and port %s failed.",
-                job_type,
-                nomad_job,
-                nomad_host,
-                nomad_port,
-                job=str(job.id),
-            )
-            raise
-        except Exception as e:
-            logger.info(
-                "Unable to Dispatch Nomad Job.",
-                job_name=job_type.value,
+            queued_count += 1
+        except Exception:
+            # The job was already dispatched, so keep saving the others.
+            logger.exception(
+                "Unable to save the Nomad job id of a dispatched job.",
                 job_id=str(job.id),
-                reason=str(e),
+                nomad_job_id=nomad_job_id,
             )
-            raise
-    else:
-        job.num_retries = job.num_retries - 1
-        job.save()
-    return True
+
+    return queued_count
@@ -9,6 +9,9 @@ logger = get_and_configure_logger(__name__)
 
 ENSG_PKG_FILENAME = "/home/user/r_ensg_probe_pkgs.txt"
 
+# Used to strip the punctuation out of the package names in CEL file headers.
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
 
 def get_platform_from_CEL(cel_file_path: str) -> str:
     """.CEL files have a header which contains platform information.
@@ -31,5 +34,4 @@ def get_platform_from_CEL(cel_file_path: str) -> str:
 
     # header is a list of vectors. [0][0] contains the package name.
     # However it contains punctuation which can be variable.
-    punctuation_table = str.maketrans(dict.fromkeys(string.punctuation))
-    return header[0][0].translate(punctuation_table).lower()
+    return header[0][0].translate(PUNCTUATION_TABLE).lower()
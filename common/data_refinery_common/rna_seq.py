@@ -1,14 +1,31 @@
 from typing import List
 
-from django.db.models import OuterRef, Subquery
+from django.db.models import OuterRef, Q, Subquery
 
+from data_refinery_common.constants import CURRENT_SALMON_VERSION
 from data_refinery_common.job_lookup import ProcessorEnum
 from data_refinery_common.logging import get_and_configure_logger
 from data_refinery_common.models import ComputationalResult, Experiment
-from data_refinery_common.utils import get_env_variable
 
 logger = get_and_configure_logger(__name__)
 
+# The name of the processor that salmon quant results are saved with.
+SALMON_QUANT_PROCESSOR_NAME = ProcessorEnum.SALMON_QUANT.value["name"]
+
+
+def get_uploaded_results_filter(prefix: str = "") -> Q:
+    """Returns a filter for ComputationalResults whose computed files were uploaded.
+
+    `prefix` is the lookup path to the results when filtering a related
+    model, e.g. "samples__results__" for Experiments.
+    """
+    return Q(
+        **{
+            prefix + "computedfile__s3_bucket__isnull": False,
+            prefix + "computedfile__s3_key__isnull": False,
+        }
+    )
+
 
 # Some experiments won't be entirely processed, but we'd still like to
 # make the samples we can process available. This means we need to run
@@ -74,32 +91,37 @@ def should_run_tximport(experiment: Experiment, results, is_tximport_job: bool):
         return False
 
 
-def get_quant_results_for_experiment(experiment: Experiment, filter_old_versions=True):
-    """Returns a queryset of salmon quant results from `experiment`."""
-    # Subquery to calculate quant results
-    # https://docs.djangoproject.com/en/2.2/ref/models/expressions/#subquery-expressions
-
-    # Salmon version gets saved as what salmon outputs, which includes this prefix.
-    current_salmon_version = "salmon " + get_env_variable("SALMON_VERSION", "0.13.1")
+def get_newest_quant_results_for_sample(filter_old_versions=True):
+    """Returns a queryset of salmon quant results for the sample referenced
+    by OuterRef("id"), newest first.
 
+    This is meant to be used as a subquery of a Sample queryset.
+    """
     if filter_old_versions:
         eligible_results = ComputationalResult.objects.prefetch_related("organism_index").filter(
-            organism_index__salmon_version=current_salmon_version
+            organism_index__salmon_version=CURRENT_SALMON_VERSION
         )
     else:
         eligible_results = ComputationalResult.objects.all()
 
     # A result is only eligible to be used if it actually got uploaded.
     eligible_results = eligible_results.select_related("computedfile").filter(
-        computedfile__s3_bucket__isnull=False, computedfile__s3_key__isnull=False
+        get_uploaded_results_filter()
     )
 
     # Calculate the computational results sorted that are associated with a given sample (
     # referenced from the top query)
-    newest_computational_results = eligible_results.filter(
-        samples=OuterRef("id"), processor__name=ProcessorEnum.SALMON_QUANT.value["name"],
+    return eligible_results.filter(
+        samples=OuterRef("id"), processor__name=SALMON_QUANT_PROCESSOR_NAME
     ).order_by("-created_at")
 
+
+def get_quant_results_for_experiment(experiment: Experiment, filter_old_versions=True):
+    """Returns a queryset of salmon quant results from `experiment`."""
+    # Subquery to calculate quant results
+    # https://docs.djangoproject.com/en/2.2/ref/models/expressions/#subquery-expressions
+    newest_computational_results = get_newest_quant_results_for_sample(filter_old_versions)
+
     # Annotate each sample in the experiment with the id of the most recent computational result
     computational_results_ids = (
         experiment.samples.all()
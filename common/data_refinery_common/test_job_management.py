@@ -1,6 +1,11 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
+from data_refinery_common.job_lookup import ProcessorPipeline
 from data_refinery_common.job_management import create_processor_job_for_original_files
+from data_refinery_common.message_queue import send_jobs
+from data_refinery_common.models import ProcessorJob
 
 
 class UtilsTestCase(TestCase):
@@ -9,3 +14,49 @@ class UtilsTestCase(TestCase):
         create_processor_job_for_original_files([])
 
         self.assertTrue(True)
+
+    @patch("data_refinery_common.message_queue.nomad.Nomad")
+    def test_send_jobs_continues_after_failure(self, mock_nomad):
+        """Make sure one job failing to be queued doesn't stop the others."""
+        jobs = []
+        for _ in range(3):
+            processor_job = ProcessorJob()
+            processor_job.pipeline_applied = ProcessorPipeline.SALMON.value
+            processor_job.volume_index = "0"
+            processor_job.save()
+            jobs.append(processor_job)
+
+        unqueueable_job_id = str(jobs[1].id)
+
+        def dispatch_job(nomad_job, meta):
+            if meta["JOB_ID"] == unqueueable_job_id:
+                raise Exception("Nomad is down!")
+            return {"DispatchedJobID": "nomad-" + meta["JOB_ID"]}
+
+        mock_nomad.return_value.job.dispatch_job.side_effect = dispatch_job
+
+        self.assertEqual(send_jobs([(ProcessorPipeline.SALMON, job) for job in jobs]), 2)
+
+        for job in jobs:
+            job.refresh_from_db()
+
+        self.assertEqual(jobs[0].nomad_job_id, "nomad-" + str(jobs[0].id))
+        self.assertIsNone(jobs[1].nomad_job_id)
+        self.assertEqual(jobs[2].nomad_job_id, "nomad-" + str(jobs[2].id))
+
+    @patch("data_refinery_common.message_queue.ThreadPoolExecutor")
+    @patch("data_refinery_common.message_queue.nomad.Nomad")
+    def test_send_jobs_single_job(self, mock_nomad, mock_executor):
+        """Make sure a single job is dispatched without starting any threads."""
+        processor_job = ProcessorJob()
+        processor_job.pipeline_applied = ProcessorPipeline.SALMON.value
+        processor_job.volume_index = "0"
+        processor_job.save()
+
+        mock_nomad.return_value.job.dispatch_job.return_value = {"DispatchedJobID": "nomad-job"}
+
+        self.assertEqual(send_jobs([(ProcessorPipeline.SALMON, processor_job)]), 1)
+        mock_executor.assert_not_called()
+
+        processor_job.refresh_from_db()
+        self.assertEqual(processor_job.nomad_job_id, "nomad-job")
@@ -71,7 +71,7 @@ class Command(BaseCommand):
         while True:
             for sample in page.object_list:
                 logger.debug("Creating downloader job for a sample.", sample=sample.accession_code)
-                create_downloader_job(sample.original_files.all())
+                create_downloader_job(sample.original_files.all(), sample=sample)
 
             logger.info(
                 "Created %d new downloader jobs because their samples didn't have any.", PAGE_SIZE
@@ -57,7 +57,7 @@ class Command(BaseCommand):
                         )
                         volume_index = find_volume_index_for_dl_job(dl_job)
                         create_processor_job_for_original_files(
-                            original_files, dl_job, volume_index
+                            original_files, dl_job, volume_index, sample=sample_object
                         )
                     except Exception:
                         # Already logged.
@@ -93,7 +93,7 @@ class Command(BaseCommand):
 
                                 volume_index = find_volume_index_for_dl_job(dl_job)
                                 create_processor_jobs_for_original_files(
-                                    files_for_sample, dl_job, volume_index
+                                    files_for_sample, dl_job, volume_index, sample=sample
                                 )
                             except Exception:
                                 # Already logged.
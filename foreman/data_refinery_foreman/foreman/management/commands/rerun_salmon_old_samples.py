@@ -3,75 +3,144 @@ that multiple versions of salmon have been used on the samples.
 """
 
 import sys
+from collections import defaultdict
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count
+from django.db.models import Count, Subquery
 from django.db.models.expressions import Q
 
-from data_refinery_common.job_lookup import ProcessorEnum, ProcessorPipeline
+from data_refinery_common.job_lookup import ProcessorPipeline
 from data_refinery_common.job_management import create_downloader_job
 from data_refinery_common.logging import get_and_configure_logger
-from data_refinery_common.models import Experiment, ProcessorJob
-from data_refinery_common.rna_seq import get_quant_results_for_experiment
+from data_refinery_common.models import (
+    Experiment,
+    OriginalFile,
+    OriginalFileSampleAssociation,
+    ProcessorJob,
+    Sample,
+)
+from data_refinery_common.rna_seq import (
+    SALMON_QUANT_PROCESSOR_NAME,
+    get_newest_quant_results_for_sample,
+    get_uploaded_results_filter,
+)
 
 logger = get_and_configure_logger(__name__)
 
+CHUNK_SIZE = 500
+
+
+def get_files_with_open_processor_jobs(experiment: Experiment):
+    """Returns the ids of the original files in `experiment` that have salmon processor jobs
+    the foreman might want to retry (failed | hung | lost).
+    """
+    return set(
+        ProcessorJob.objects.filter(
+            original_files__samples__experiments=experiment,
+            pipeline_applied=ProcessorPipeline.SALMON,
+        )
+        .filter(
+            Q(success=False, retried=False, no_retry=False)
+            | Q(
+                success=None,
+                retried=False,
+                no_retry=False,
+                start_time__isnull=False,
+                end_time=None,
+                nomad_job_id__isnull=False,
+            )
+            | Q(success=None, retried=False, no_retry=False, start_time=None, end_time=None)
+        )
+        .values_list("original_files__id", flat=True)
+    )
+
 
 def update_salmon_versions(experiment: Experiment):
-    quant_results = (
-        get_quant_results_for_experiment(experiment, filter_old_versions=False)
-        .order_by("-organism_index__created_at")
-        .prefetch_related("organism_index")
-        .prefetch_related("samples__original_files")
+    # Annotate each sample with the salmon version of its newest quant
+    # result and when that version's organism index was created, so
+    # that we can tell which samples need to be rerun with one query.
+    newest_quant_results = get_newest_quant_results_for_sample(filter_old_versions=False)
+    sample_salmon_versions = (
+        experiment.samples.annotate(
+            salmon_version=Subquery(
+                newest_quant_results.values("organism_index__salmon_version")[:1]
+            ),
+            organism_index_created_at=Subquery(
+                newest_quant_results.values("organism_index__created_at")[:1]
+            ),
+        )
+        .filter(salmon_version__isnull=False)
+        .values_list("id", "salmon_version", "organism_index_created_at")
     )
 
-    total_samples_queued = 0
+    # The latest salmon version is the one with the most recently created
+    # organism index. We can safely ignore the samples that were processed with it.
     latest_salmon_version = None
-    for quant_result in quant_results:
-        if not latest_salmon_version:
-            # we can safely ignore the latest salmon version, that will be the first
-            # quant result. Note we are ordering by -organism_index__created_at
-            latest_salmon_version = quant_result.organism_index.salmon_version
-        elif latest_salmon_version != quant_result.organism_index.salmon_version:
-            # we found a quant result associated with an experiment where we need to run salmon
-            # hopefully each computational result is associated with a single sample
-            for sample in quant_result.samples.all():
-                original_files = list(sample.original_files.all())
-
-                if not len(original_files):
-                    continue
-
-                # Ensure that there's no processor jobs for these original files that the foreman
-                # might want to retry (failed | hung | lost)
-                has_open_processor_job = (
-                    ProcessorJob.objects.filter(
-                        original_files=original_files[0], pipeline_applied=ProcessorPipeline.SALMON
-                    )
-                    .filter(
-                        Q(success=False, retried=False, no_retry=False)
-                        | Q(
-                            success=None,
-                            retried=False,
-                            no_retry=False,
-                            start_time__isnull=False,
-                            end_time=None,
-                            nomad_job_id__isnull=False,
-                        )
-                        | Q(
-                            success=None,
-                            retried=False,
-                            no_retry=False,
-                            start_time=None,
-                            end_time=None,
-                        )
-                    )
-                    .exists()
-                )
-                if has_open_processor_job:
-                    continue
-
-                create_downloader_job(original_files, force=True)
-                total_samples_queued += 1
+    latest_created_at = None
+    for _, salmon_version, created_at in sample_salmon_versions:
+        if not latest_created_at or created_at > latest_created_at:
+            latest_salmon_version = salmon_version
+            latest_created_at = created_at
+
+    sample_ids_to_rerun = [
+        sample_id
+        for sample_id, salmon_version, _ in sample_salmon_versions
+        if salmon_version != latest_salmon_version
+    ]
+
+    files_with_open_processor_jobs = set()
+    if sample_ids_to_rerun:
+        files_with_open_processor_jobs = get_files_with_open_processor_jobs(experiment)
+
+    total_samples_queued = 0
+    # Some experiments have thousands of samples, so load them and their
+    # original files in chunks to keep memory usage bounded.
+    for chunk_start in range(0, len(sample_ids_to_rerun), CHUNK_SIZE):
+        sample_ids_chunk = sample_ids_to_rerun[chunk_start : chunk_start + CHUNK_SIZE]
+
+        original_file_ids_by_sample = defaultdict(list)
+        sample_file_ids = (
+            OriginalFileSampleAssociation.objects.filter(sample_id__in=sample_ids_chunk)
+            .order_by("id")
+            .values_list("sample_id", "original_file_id")
+        )
+        for sample_id, original_file_id in sample_file_ids:
+            original_file_ids_by_sample[sample_id].append(original_file_id)
+
+        # Samples without original files never show up in
+        # original_file_ids_by_sample. Skipping the ones with open processor
+        # jobs before loading anything means we only load what we requeue.
+        # Any of a sample's files can be the one its open job is for, so
+        # check all of them.
+        sample_ids_to_queue = [
+            sample_id
+            for sample_id, original_file_ids in original_file_ids_by_sample.items()
+            if files_with_open_processor_jobs.isdisjoint(original_file_ids)
+        ]
+        if not sample_ids_to_queue:
+            continue
+
+        original_files = OriginalFile.objects.in_bulk(
+            [
+                original_file_id
+                for sample_id in sample_ids_to_queue
+                for original_file_id in original_file_ids_by_sample[sample_id]
+            ]
+        )
+
+        # Samples have a lot of metadata columns, but only the ones
+        # create_downloader_job might need are loaded.
+        samples = Sample.objects.only(
+            "id", "accession_code", "source_database", "platform_accession_code", "has_raw"
+        ).in_bulk(sample_ids_to_queue)
+
+        for sample_id in sample_ids_to_queue:
+            sample_original_files = [
+                original_files[original_file_id]
+                for original_file_id in original_file_ids_by_sample[sample_id]
+            ]
+            create_downloader_job(sample_original_files, force=True, sample=samples[sample_id])
+            total_samples_queued += 1
 
     logger.info(
         "Re-ran Salmon for %d samples in experiment %s.",
@@ -82,22 +151,42 @@ def update_salmon_versions(experiment: Experiment):
 
 def update_salmon_all_experiments():
     """Creates a tximport job for all eligible experiments."""
+    # Only results that were uploaded are considered by
+    # get_newest_quant_results_for_sample, so there's no point in counting
+    # the salmon versions of the ones that weren't. Doing this filtering
+    # here means update_salmon_versions is never called for experiments
+    # where it would have nothing to do.
     eligible_experiments = (
         Experiment.objects.filter(technology="RNA-SEQ", num_processed_samples=0)
         .annotate(
             num_salmon_versions=Count(
                 "samples__results__organism_index__salmon_version",
                 distinct=True,
-                filter=Q(
-                    samples__results__processor__name=ProcessorEnum.SALMON_QUANT.value["name"]
-                ),
+                filter=Q(samples__results__processor__name=SALMON_QUANT_PROCESSOR_NAME)
+                & get_uploaded_results_filter("samples__results__"),
             )
         )
         .filter(num_salmon_versions__gt=1)
+        .only("id", "accession_code", "technology")
     )
 
-    for experiment in eligible_experiments:
-        update_salmon_versions(experiment)
+    # There can be a lot of eligible experiments so page through them
+    # using their ids instead of loading all of them at once. This can't
+    # use iterator() because the Foreman connects through PgBouncer in
+    # transaction mode, which doesn't support server-side cursors.
+    last_id = 0
+    while True:
+        page = list(eligible_experiments.filter(id__gt=last_id).order_by("id")[:CHUNK_SIZE])
+        if not page:
+            break
+
+        for experiment in page:
+            update_salmon_versions(experiment)
+
+        if len(page) < CHUNK_SIZE:
+            break
+
+        last_id = page[-1].id
 
 
 class Command(BaseCommand):
@@ -1,49 +1,95 @@
 import time
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Exists, OuterRef, Subquery
 
 from dateutil.parser import parse as parse_date
 
 from data_refinery_common.job_management import create_downloader_job
 from data_refinery_common.logging import get_and_configure_logger
-from data_refinery_common.models import ComputedFile, ProcessorJob, Sample
-from data_refinery_common.performant_pagination.pagination import PerformantPaginator as Paginator
+from data_refinery_common.models import (
+    ComputedFile,
+    DownloaderJob,
+    ProcessorJob,
+    Sample,
+    SampleComputedFileAssociation,
+)
+from data_refinery_foreman.foreman.main import JOB_CREATED_AT_CUTOFF
 
 logger = get_and_configure_logger(__name__)
 
 PAGE_SIZE = 2000
 
+# Downloader jobs are created faster than they can be downloaded, so
+# stop creating new ones while there are this many waiting to be
+# started. The Foreman starts them as the cluster has capacity, which
+# means samples get requeued about as fast as they're being downloaded.
+MAX_QUEUED_DOWNLOADER_JOBS = 10 * PAGE_SIZE
+
+# How many seconds to wait before checking the queue again when it's full.
+QUEUE_CHECK_INTERVAL = 10
+
+
+def wait_for_downloader_queue():
+    """Blocks until there is room in the downloader job queue."""
+    has_waited = False
+    while True:
+        queued_jobs = DownloaderJob.lost_objects.filter(
+            created_at__gt=JOB_CREATED_AT_CUTOFF
+        ).count()
+
+        if queued_jobs < MAX_QUEUED_DOWNLOADER_JOBS:
+            return
+
+        # This can wait for a long time if the Foreman isn't starting
+        # jobs, so make sure it's visible why nothing is being requeued.
+        if not has_waited:
+            logger.info(
+                "Too many downloader jobs are waiting to be started, pausing requeueing.",
+                queued_jobs=queued_jobs,
+                max_queued_jobs=MAX_QUEUED_DOWNLOADER_JOBS,
+            )
+            has_waited = True
+        else:
+            logger.debug("Waiting for downloader jobs to be started.", queued_jobs=queued_jobs)
+
+        time.sleep(QUEUE_CHECK_INTERVAL)
 
-def requeue_samples(eligible_samples):
-    paginator = Paginator(eligible_samples, PAGE_SIZE)
-    page = paginator.page()
 
+def requeue_samples(eligible_samples):
+    # Page through the samples using their ids rather than an offset so
+    # that each page is a single indexed query, no matter how far in we are.
+    last_id = 0
     creation_count = 0
     while True:
-        for sample in page.object_list:
-            if create_downloader_job(sample.original_files.all(), force=True):
+        page = list(eligible_samples.filter(id__gt=last_id).order_by("id")[:PAGE_SIZE])
+        if not page:
+            break
+
+        wait_for_downloader_queue()
+
+        for sample in page:
+            if create_downloader_job(sample.original_files.all(), force=True, sample=sample):
                 creation_count += 1
 
-        if not page.has_next():
+        if len(page) < PAGE_SIZE:
             break
-        else:
-            page = paginator.page(page.next_page_number())
 
-        logger.info("Creating new downloader jobs. %d so far", creation_count)
+        last_id = page[-1].id
 
-        # 2000 samples queued up every five minutes should be fast
-        # enough and also not thrash the DB.
-        time.sleep(60 * 5)
+        logger.info("Creating new downloader jobs. %d so far", creation_count)
 
     return creation_count
 
 
 def retry_by_source_database(source_database):
+    # Checking whether any computed files exist lets the database stop
+    # at the first one, instead of counting all of them for every sample.
+    computed_files_for_sample = SampleComputedFileAssociation.objects.filter(sample=OuterRef("id"))
     sra_samples = (
         Sample.objects.filter(source_database=source_database, is_processed=False)
-        .annotate(num_computed_files=Count("computed_files"))
-        .filter(num_computed_files__gt=0)
+        .annotate(has_computed_files=Exists(computed_files_for_sample))
+        .filter(has_computed_files=False)
         .prefetch_related("original_files")
     )
 
@@ -237,6 +237,36 @@ def setup_experiment(new_version_accessions: List[str], old_version_accessions:
     return experiment
 
 
+def create_failed_salmon_job(original_file: OriginalFile) -> ProcessorJob:
+    """ Create a failed salmon job that the foreman would retry for `original_file`. """
+    processor_job = ProcessorJob()
+    processor_job.pipeline_applied = ProcessorPipeline.SALMON
+    processor_job.ram_amount = 1024
+    processor_job.success = False
+    processor_job.retried = False
+    processor_job.no_retry = False
+    processor_job.save()
+
+    assoc = ProcessorJobOriginalFileAssociation()
+    assoc.original_file = original_file
+    assoc.processor_job = processor_job
+    assoc.save()
+
+    return processor_job
+
+
+def add_original_file(sample: Sample, filename: str) -> OriginalFile:
+    """ Create another original file for `sample`. """
+    original_file = OriginalFile()
+    original_file.filename = filename
+    original_file.source_filename = filename
+    original_file.save()
+
+    OriginalFileSampleAssociation.objects.create(original_file=original_file, sample=sample)
+
+    return original_file
+
+
 class RerunSalmonTestCase(TestCase):
     """
     Tests that new processor jobs are created for samples that belong to experiments that were
@@ -262,21 +292,81 @@ class RerunSalmonTestCase(TestCase):
         experiment = setup_experiment([], ["GSM001"])
 
         # create a failed job for that experiment
-        processor_job = ProcessorJob()
-        processor_job.pipeline_applied = ProcessorPipeline.SALMON
-        processor_job.ram_amount = 1024
-        processor_job.success = False
-        processor_job.retried = False
-        processor_job.no_retry = False
-        processor_job.save()
-
-        assoc = ProcessorJobOriginalFileAssociation()
-        assoc.original_file = experiment.samples.first().original_files.first()
-        assoc.processor_job = processor_job
-        assoc.save()
+        create_failed_salmon_job(experiment.samples.first().original_files.first())
 
         # Run command
         update_salmon_all_experiments()
 
         dl_jobs = DownloaderJob.objects.all()
         self.assertEqual(dl_jobs.count(), 0)
+
+    def test_most_samples_on_old_version(self):
+        """The latest version is the one with the newest organism index, even if most of the
+        samples were processed with an older version that sorts after it as a string.
+        """
+        setup_experiment(["SS001"], ["SS002", "SS003"])
+        update_salmon_all_experiments()
+
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 2)
+        self.assertEqual(set(dl_jobs.values_list("accession_code", flat=True)), {"SS002", "SS003"})
+
+    def test_sample_without_quant_results_is_skipped(self):
+        experiment = setup_experiment(["SS001"], ["SS002"])
+
+        # A sample that was never processed doesn't have a salmon version to update.
+        sample = Sample.objects.create(
+            accession_code="SS003",
+            organism=Organism.get_object_for_name("DANIO_RERIO"),
+            source_database="SRA",
+            technology="RNA-SEQ",
+            platform_accession_code="IlluminaHiSeq1000",
+        )
+        ExperimentSampleAssociation.objects.create(experiment=experiment, sample=sample)
+        add_original_file(sample, "SS003.SRA")
+
+        update_salmon_all_experiments()
+
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 1)
+        self.assertEqual(dl_jobs.first().accession_code, "SS002")
+
+    def test_no_job_created_for_old_sample_with_failed_job(self):
+        experiment = setup_experiment(["SS001"], ["SS002", "SS003"])
+
+        create_failed_salmon_job(
+            experiment.samples.get(accession_code="SS002").original_files.first()
+        )
+
+        update_salmon_all_experiments()
+
+        # Only the old sample without an open job gets rerun.
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 1)
+        self.assertEqual(dl_jobs.first().accession_code, "SS003")
+
+    def test_old_sample_with_multiple_files(self):
+        experiment = setup_experiment(["SS001"], ["SS002"])
+
+        sample = experiment.samples.get(accession_code="SS002")
+        add_original_file(sample, "SS002_2.SRA")
+
+        update_salmon_all_experiments()
+
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 1)
+        self.assertEqual(
+            set(dl_jobs.first().original_files.values_list("filename", flat=True)),
+            {"SS002.SRA", "SS002_2.SRA"},
+        )
+
+    def test_no_job_created_when_failed_job_is_for_second_file(self):
+        experiment = setup_experiment(["SS001"], ["SS002"])
+
+        sample = experiment.samples.get(accession_code="SS002")
+        create_failed_salmon_job(add_original_file(sample, "SS002_2.SRA"))
+
+        update_salmon_all_experiments()
+
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 0)
@@ -1,4 +1,5 @@
 from typing import Dict
+from unittest.mock import patch
 
 from django.test import TestCase
 from django.utils import timezone
@@ -21,9 +22,14 @@ from data_refinery_common.models import (
     ProcessorJob,
     ProcessorJobOriginalFileAssociation,
     Sample,
+    SampleComputedFileAssociation,
     SampleResultAssociation,
 )
-from data_refinery_foreman.foreman.management.commands.retry_samples import retry_by_regex
+from data_refinery_foreman.foreman.management.commands import retry_samples
+from data_refinery_foreman.foreman.management.commands.retry_samples import (
+    retry_by_regex,
+    retry_by_source_database,
+)
 
 
 def setup_experiment() -> Dict:
@@ -101,3 +107,53 @@ class RetrySamples(TestCase):
 
         dl_jobs = DownloaderJob.objects.all()
         self.assertEqual(dl_jobs.count(), 1)
+
+    def test_retry_by_source_database(self):
+        experiment = setup_experiment()
+
+        # Only the sample without computed files should be requeued.
+        result = ComputationalResult()
+        result.save()
+
+        computed_file = ComputedFile()
+        computed_file.result = result
+        computed_file.filename = "S001.PCL"
+        computed_file.size_in_bytes = 12345
+        computed_file.sha1 = "ABC"
+        computed_file.save()
+        SampleComputedFileAssociation.objects.create(
+            sample=experiment.samples.get(accession_code="S001"), computed_file=computed_file
+        )
+
+        retry_by_source_database("SRA")
+
+        dl_jobs = DownloaderJob.objects.all()
+        self.assertEqual(dl_jobs.count(), 1)
+        self.assertEqual(dl_jobs.first().accession_code, "S002")
+
+    @patch("data_refinery_foreman.foreman.management.commands.retry_samples.time.sleep")
+    @patch(
+        "data_refinery_foreman.foreman.management.commands.retry_samples.MAX_QUEUED_DOWNLOADER_JOBS",
+        3,
+    )
+    def test_waits_for_downloader_queue(self, mock_sleep):
+        setup_experiment()
+
+        # Fill up the queue with downloader jobs that haven't been started.
+        DownloaderJob.objects.bulk_create(
+            [
+                DownloaderJob(downloader_task="SRA", accession_code="QUEUED")
+                for _ in range(retry_samples.MAX_QUEUED_DOWNLOADER_JOBS)
+            ]
+        )
+
+        def start_queued_jobs(seconds):
+            DownloaderJob.objects.filter(accession_code="QUEUED").update(start_time=timezone.now())
+
+        mock_sleep.side_effect = start_queued_jobs
+
+        retry_by_regex("ProcessorJob has already completed .*")
+
+        # It should have waited once for the queued jobs to start before requeueing.
+        mock_sleep.assert_called_once_with(retry_samples.QUEUE_CHECK_INTERVAL)
+        self.assertEqual(DownloaderJob.objects.filter(accession_code="S002").count(), 1)
@@ -329,7 +329,7 @@ def download_sra(job_id: int) -> None:
             break
 
     if success:
-        create_processor_job_for_original_files(downloaded_files, job)
+        create_processor_job_for_original_files(downloaded_files, job, sample=sample)
 
     utils.end_downloader_job(job, success)
 
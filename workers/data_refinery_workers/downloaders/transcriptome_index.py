@@ -110,12 +110,14 @@ def create_long_and_short_processor_jobs(files_to_process):
     processor_job_long.ram_amount = 4096
     processor_job_long.save()
 
-    for original_file in files_to_process:
-
-        assoc = ProcessorJobOriginalFileAssociation()
-        assoc.original_file = original_file
-        assoc.processor_job = processor_job_long
-        assoc.save()
+    ProcessorJobOriginalFileAssociation.objects.bulk_create(
+        [
+            ProcessorJobOriginalFileAssociation(
+                original_file=original_file, processor_job=processor_job_long
+            )
+            for original_file in files_to_process
+        ]
+    )
 
     try:
         send_job(ProcessorPipeline[processor_job_long.pipeline_applied], processor_job_long)
@@ -128,12 +130,14 @@ def create_long_and_short_processor_jobs(files_to_process):
     processor_job_short.ram_amount = 4096
     processor_job_short.save()
 
-    for original_file in files_to_process:
-
-        assoc = ProcessorJobOriginalFileAssociation()
-        assoc.original_file = original_file
-        assoc.processor_job = processor_job_short
-        assoc.save()
+    ProcessorJobOriginalFileAssociation.objects.bulk_create(
+        [
+            ProcessorJobOriginalFileAssociation(
+                original_file=original_file, processor_job=processor_job_short
+            )
+            for original_file in files_to_process
+        ]
+    )
 
     try:
         send_job(ProcessorPipeline[processor_job_short.pipeline_applied], processor_job_short)
@@ -7,7 +7,7 @@ from typing import Dict
 from django.utils import timezone
 
 import rpy2.robjects as ro
-from rpy2.rinterface import RRuntimeError
+from rpy2.rinterface import RRuntimeError, RRuntimeWarning
 
 from data_refinery_common.job_lookup import PipelineEnum
 from data_refinery_common.logging import get_and_configure_logger
@@ -25,6 +25,15 @@ S3_BUCKET_NAME = get_env_variable("S3_BUCKET_NAME", "data-refinery")
 
 logger = get_and_configure_logger(__name__)
 
+# rpy2 turns the messages R prints into RRuntimeWarnings, which SCAN
+# produces a lot of. This filter is process-wide, so it also silences
+# them for every other processor in this worker, such as Affymetrix.
+warnings.filterwarnings("ignore", category=RRuntimeWarning)
+
+# Looked up the first time it's needed rather than at import time so
+# that importing this module doesn't start R.
+SCAN_TWOCOLOR = None
+
 
 def _prepare_files(job_context: Dict) -> Dict:
     """Populate our job_context with appropriate inputs and outputs
@@ -33,18 +42,32 @@ def _prepare_files(job_context: Dict) -> Dict:
     job_context so everything is prepared for processing.
     """
     original_file = job_context["original_files"][0]
-    job_context["input_file_path"] = original_file.absolute_file_path
-    # Turns /home/user/data_store/E-GEOD-8607/raw/foo.txt into /home/user/data_store/E-GEOD-8607/processed/foo.cel
-    pre_part = original_file.absolute_file_path.split("/")[:-2]
-    end_part = original_file.absolute_file_path.split("/")[-1]
+    input_file_path = original_file.absolute_file_path
+    job_context["input_file_path"] = input_file_path
+    # Turns /home/user/data_store/E-GEOD-8607/raw/foo.txt into /home/user/data_store/E-GEOD-8607/processed/foo.PCL
+    processed_dir = os.path.join(os.path.dirname(os.path.dirname(input_file_path)), "processed")
+    os.makedirs(processed_dir, exist_ok=True)
 
-    os.makedirs("/".join(pre_part) + "/processed/", exist_ok=True)
-    job_context["output_file_path"] = "/".join(pre_part) + "/processed/" + end_part
-    job_context["output_file_path"] = job_context["output_file_path"].replace(".txt", ".PCL")
+    # Only the extension should be replaced, not every ".txt" in the filename.
+    output_filename = os.path.basename(input_file_path)
+    if output_filename.endswith(".txt"):
+        output_filename = output_filename[: -len(".txt")] + ".PCL"
+
+    job_context["output_file_path"] = os.path.join(processed_dir, output_filename)
 
     return job_context
 
 
+def _get_scan_twocolor():
+    """Returns SCAN.UPC's SCAN_TwoColor R function."""
+    global SCAN_TWOCOLOR
+
+    if SCAN_TWOCOLOR is None:
+        SCAN_TWOCOLOR = ro.r["::"]("SCAN.UPC", "SCAN_TwoColor")
+
+    return SCAN_TWOCOLOR
+
+
 def _run_scan_twocolor(job_context: Dict) -> Dict:
     """Processes an input TXT file to an output PCL file.
 
@@ -64,16 +87,12 @@ def _run_scan_twocolor(job_context: Dict) -> Dict:
         # to see the first 50)
         ro.r("options(warn=1)")
 
-        # All R messages are turned into Python 'warnings' by rpy2. By
-        # filtering all of them we silence a lot of useless output
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            scan_upc = ro.r["::"]("SCAN.UPC", "SCAN_TwoColor")
-            job_context["time_start"] = timezone.now()
+        scan_upc = _get_scan_twocolor()
+        job_context["time_start"] = timezone.now()
 
-            # XXX: Current bug lives here. See below.
-            scan_upc(input_file, job_context["output_file_path"])
-            job_context["time_end"] = timezone.now()
+        # XXX: Current bug lives here. See below.
+        scan_upc(input_file, job_context["output_file_path"])
+        job_context["time_end"] = timezone.now()
 
     except RRuntimeError as e:
 
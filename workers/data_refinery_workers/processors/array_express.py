@@ -1,5 +1,4 @@
 import os
-import string
 import warnings
 from typing import Dict
 
@@ -10,6 +9,7 @@ from rpy2.rinterface import RRuntimeError
 
 from data_refinery_common.job_lookup import PipelineEnum
 from data_refinery_common.logging import get_and_configure_logger
+from data_refinery_common.microarray import PUNCTUATION_TABLE
 from data_refinery_common.models import (
     ComputationalResult,
     ComputedFile,
@@ -28,6 +28,13 @@ S3_BUCKET_NAME = get_env_variable("S3_BUCKET_NAME", "data-refinery")
 LOCAL_ROOT_DIR = get_env_variable("LOCAL_ROOT_DIR", "/home/user/data_store")
 logger = get_and_configure_logger(__name__)
 
+CHIP_PKG_MAP = None
+
+# These R functions are looked up the first time they're needed rather
+# than at import time so that importing this module doesn't start R.
+READ_CELFILE_HEADER = None
+SCAN_FAST = None
+
 
 def _prepare_files(job_context: Dict) -> Dict:
     """Moves the CEL file from the raw directory to the temp directory.
@@ -63,19 +70,47 @@ def _create_ensg_pkg_map() -> Dict:
     """Reads the text file that was generated when installing ensg R
     packages, and returns a map whose keys are chip names and values are
     the corresponding BrainArray ensg package name.
+
+    The file doesn't change while the worker is running, so it's only
+    read the first time this is called.
     """
+    global CHIP_PKG_MAP
+
+    if CHIP_PKG_MAP is not None:
+        return CHIP_PKG_MAP
+
     ensg_pkg_filename = "/home/user/r_ensg_probe_pkgs.txt"
     chip2pkg = dict()
     with open(ensg_pkg_filename) as file_handler:
         for line in file_handler:
-            tokens = line.strip("\n").split("\t")
-            # tokens[0] is (normalized) chip name,
-            # tokens[1] is the package's URL in this format:
+            # chip_name is the (normalized) chip name,
+            # pkg_url is the package's URL in this format:
             # http://mbni.org/customcdf/<version>/ensg.download/<pkg>_22.0.0.tar.gz
-            pkg_name = tokens[1].split("/")[-1].split("_")[0]
-            chip2pkg[tokens[0]] = pkg_name
+            chip_name, pkg_url = line.rstrip("\n").split("\t", 1)
+            chip2pkg[chip_name] = pkg_url.rsplit("/", 1)[-1].split("_", 1)[0]
+
+    CHIP_PKG_MAP = chip2pkg
+    return CHIP_PKG_MAP
+
+
+def _get_read_celfile_header():
+    """Returns affyio's read.celfile.header R function."""
+    global READ_CELFILE_HEADER
+
+    if READ_CELFILE_HEADER is None:
+        READ_CELFILE_HEADER = ro.r["::"]("affyio", "read.celfile.header")
+
+    return READ_CELFILE_HEADER
+
+
+def _get_scan_fast():
+    """Returns SCAN.UPC's SCANfast R function."""
+    global SCAN_FAST
+
+    if SCAN_FAST is None:
+        SCAN_FAST = ro.r["::"]("SCAN.UPC", "SCANfast")
 
-    return chip2pkg
+    return SCAN_FAST
 
 
 def _determine_brainarray_package(job_context: Dict) -> Dict:
@@ -86,7 +121,7 @@ def _determine_brainarray_package(job_context: Dict) -> Dict:
     """
     input_file = job_context["input_file_path"]
     try:
-        header = ro.r["::"]("affyio", "read.celfile.header")(input_file)
+        header = _get_read_celfile_header()(input_file)
     except RRuntimeError as e:
         error_template = (
             "Unable to read Affy header in input file {0}"
@@ -100,9 +135,8 @@ def _determine_brainarray_package(job_context: Dict) -> Dict:
         return job_context
 
     # header is a list of vectors. [0][0] contains the package name.
-    punctuation_table = str.maketrans(dict.fromkeys(string.punctuation))
     # Normalize header[0][0]
-    package_name = header[0][0].translate(punctuation_table).lower()
+    package_name = header[0][0].translate(PUNCTUATION_TABLE).lower()
 
     # Headers can contain the version "v1" or "v2", which doesn't
     # appear in the brainarray package name. This replacement is
@@ -148,7 +182,7 @@ def _run_scan_upc(job_context: Dict) -> Dict:
         # filtering all of them we silence a lot of useless output
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            scan_upc = ro.r["::"]("SCAN.UPC", "SCANfast")
+            scan_upc = _get_scan_fast()
             job_context["time_start"] = timezone.now()
 
             # Related: https://github.com/AlexsLemonade/refinebio/issues/64
@@ -12,7 +12,6 @@ determine the platform accesion code and name.
 
 import os
 import shutil
-import string
 import urllib
 from typing import Dict
 
@@ -22,6 +21,7 @@ import rpy2.robjects as ro
 from rpy2.rinterface import RRuntimeError
 
 from data_refinery_common.logging import get_and_configure_logger
+from data_refinery_common.microarray import PUNCTUATION_TABLE
 from data_refinery_common.models import *
 from data_refinery_common.utils import get_env_variable, get_readable_affymetrix_names
 
@@ -70,9 +70,8 @@ def _determine_brainarray_package(input_file: str) -> Dict:
         return None
 
     # header is a list of vectors. [0][0] contains the package name.
-    punctuation_table = str.maketrans(dict.fromkeys(string.punctuation))
     # Normalize header[0][0]
-    package_name = header[0][0].translate(punctuation_table).lower()
+    package_name = header[0][0].translate(PUNCTUATION_TABLE).lower()
 
     # Headers can contain the version "v1" or "v2", which doesn't
     # appear in the brainarray package name. This replacement is